@@ -1,185 +1,428 @@
 # scripts/visualize_experiments.py
 
+# matplotlib is imported lazily inside the functions that render, so the
+# tables-only path (and anything importing this module for the frames) never
+# pays the pyplot import or rcParams rewrite.
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+import io
 from pathlib import Path
 import os
 
+_style_applied = False
+
+def _set_plot_style():
+    """Set publication-quality plot style (idempotent per process)"""
+    global _style_applied
+    if _style_applied:
+        return
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib import font_manager
+
+    # Resolve the serif font up front: findfont caches the hit, so the first
+    # savefig never stalls on a font-cache rebuild, and the generic 'serif'
+    # fallback short-circuits the lookup if DejaVu Serif is missing.
+    font_manager.findfont('DejaVu Serif')
+    # matplotlib ships the seaborn whitegrid theme, so applying it does not
+    # need the seaborn import on the hot path.
+    plt.style.use('seaborn-v0_8-whitegrid')
+    plt.rcParams.update({
+        'font.size': 11,
+        'font.family': 'serif',
+        'font.serif': ['DejaVu Serif', 'serif'],
+        'axes.labelsize': 12,
+        'axes.titlesize': 12,
+        'figure.figsize': (8, 6),
+        # PDFs are vector output: the DPI only sizes Agg's intermediate
+        # raster buffers, so 100 cuts per-figure memory 9x vs 300.
+        'figure.dpi': 100,
+        'savefig.dpi': 'figure',
+        'savefig.bbox': 'tight',
+        'savefig.pad_inches': 0.1,
+        # TrueType embedding and no TeX round-trips keep font handling cheap
+        # during savefig, which dominates publication-style PDF writes.
+        'pdf.fonttype': 42,
+        'text.usetex': False,
+    })
+    _style_applied = True
+
+def _load_cached(csv_path, usecols=None, dtype=None, parse_dates=None):
+    """Load a results CSV, caching the parsed frame as a Feather sibling.
+
+    Feather skips text tokenization and type inference entirely, so reloads
+    are an order of magnitude faster than re-parsing the CSV. The cache is
+    refreshed whenever the CSV is newer than its Feather sibling. usecols
+    limits parsing to the columns actually consumed and dtype narrows them,
+    shrinking both parse time and the resident frames.
+    """
+    feather_path = csv_path.with_suffix('.feather')
+    if feather_path.exists() and feather_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        return pd.read_feather(feather_path, columns=usecols,
+                               dtype_backend='pyarrow')
+    df = pd.read_csv(csv_path, engine='pyarrow', dtype_backend='pyarrow',
+                     usecols=usecols, dtype=dtype, parse_dates=parse_dates)
+    df.to_feather(feather_path)
+    return df
+
+def _to_soa(df, cols):
+    """Extract columns as contiguous C-ordered NumPy arrays (SoA layout)"""
+    return {c: np.ascontiguousarray(df[c].to_numpy()) for c in cols}
+
+# Figure rendering is CPU-bound in Agg and each figure is independent, so the
+# renderers below are top-level functions taking only the slim arrays they
+# plot. run_all_visualizations fans them out over a process pool; the methods
+# on ExperimentVisualizer call them directly for one-off use.
+#
+# Figure/Canvas construction costs tens of ms per call, so each process keeps
+# one reusable single-axes figure (and one two-axes figure) and clears the
+# axes between renders instead of allocating fresh ones.
+
+_shared_fig_ax = None
+_shared_fig_axes2 = None
+
+def _get_fig_ax(figsize):
+    """Return the process-wide reusable single-axes figure, cleared"""
+    global _shared_fig_ax
+    _set_plot_style()
+    import matplotlib.pyplot as plt
+    if _shared_fig_ax is None:
+        _shared_fig_ax = plt.subplots(figsize=figsize)
+    fig, ax = _shared_fig_ax
+    fig.set_size_inches(figsize)
+    ax.clear()
+    return fig, ax
+
+def _get_fig_axes2(figsize):
+    """Return the process-wide reusable 1x2-axes figure, cleared"""
+    global _shared_fig_axes2
+    _set_plot_style()
+    import matplotlib.pyplot as plt
+    if _shared_fig_axes2 is None:
+        _shared_fig_axes2 = plt.subplots(1, 2, figsize=figsize)
+    fig, axes = _shared_fig_axes2
+    fig.set_size_inches(figsize)
+    for ax in axes:
+        ax.clear()
+    return fig, axes
+
+def _render_performance_vs_noise(proof_groups, verify_groups, out_path):
+    """Render proof generation and verification time box plots"""
+    fig, (ax1, ax2) = _get_fig_axes2((14, 6))
+
+    levels, arrays = proof_groups
+    ax1.boxplot(arrays, tick_labels=levels, showfliers=True)
+    ax1.set_title('Proof Generation Time vs. Noise Level')
+    ax1.set_xlabel('Noise Level')
+    ax1.set_ylabel('Time (ms)')
+
+    levels, arrays = verify_groups
+    ax2.boxplot(arrays, tick_labels=levels, showfliers=True)
+    ax2.set_title('Verification Time vs. Noise Level')
+    ax2.set_xlabel('Noise Level')
+    ax2.set_ylabel('Time (ms)')
+
+    _save(fig, out_path)
+
+def _render_boxplot(levels, arrays, title, ylabel, out_path):
+    """Render a per-NoiseLevel box plot from pre-grouped arrays"""
+    fig, ax = _get_fig_ax((8, 6))
+    ax.boxplot(arrays, tick_labels=levels, showfliers=True)
+    ax.set_title(title)
+    ax.set_xlabel('Noise Level')
+    ax.set_ylabel(ylabel)
+    _save(fig, out_path)
+
+def _render_gas_histogram(values, title, out_path):
+    """Render a gas usage histogram with KDE overlay"""
+    fig, ax = _get_fig_ax((8, 6))
+    values = values.astype(np.float64, copy=False)
+    ax.hist(values, bins=30, density=True, rasterized=True)
+    # Evaluate the KDE on a fixed 256-point grid; scipy's gaussian_kde is
+    # pure vectorized NumPy, unlike the statsmodels fit seaborn runs for
+    # kde=True.
+    from scipy.stats import gaussian_kde
+    kde = gaussian_kde(values)
+    grid = np.linspace(values.min(), values.max(), 256)
+    ax.plot(grid, kde(grid))
+    ax.set_title(title)
+    ax.set_xlabel('Gas Used')
+    ax.set_ylabel('Density')
+    _save(fig, out_path)
+
+def _render_success_rate(levels, rates, out_path):
+    """Render the authentication success rate line plot"""
+    fig, ax = _get_fig_ax((8, 6))
+    ax.plot(levels, rates, marker='o')
+    ax.set_title('Authentication Success Rate vs. Noise Level')
+    ax.set_xlabel('Noise Level')
+    ax.set_ylabel('Success Rate (%)')
+    ax.grid(True, alpha=0.3)
+    _save(fig, out_path)
+
+def _render_memory_usage(timestamps, heap_used, heap_total, out_path):
+    """Render the memory usage timeseries"""
+    # Long runs log tens of thousands of samples, most of which land on the
+    # same sub-pixel; cap each line at ~2000 vertices so the PDF writer is
+    # not dominated by path output, and rasterize the dense lines.
+    stride = max(1, len(timestamps) // 2000)
+    timestamps = timestamps[::stride]
+    heap_used = heap_used[::stride]
+    heap_total = heap_total[::stride]
+
+    fig, ax = _get_fig_ax((10, 6))
+    ax.plot(timestamps, heap_used / 1024 / 1024, label='Heap Used',
+            rasterized=True)
+    ax.plot(timestamps, heap_total / 1024 / 1024, label='Heap Total',
+            rasterized=True)
+    ax.set_title('Memory Usage Over Time')
+    ax.set_xlabel('Time')
+    ax.set_ylabel('Memory (MB)')
+    ax.legend()
+    ax.tick_params(axis='x', rotation=45)
+    ax.grid(True, alpha=0.3)
+    _save(fig, out_path)
+
+def _save(fig, out):
+    """Write a figure to a standalone path or append it to a PdfPages"""
+    from matplotlib.backends.backend_pdf import PdfPages
+    if isinstance(out, PdfPages):
+        out.savefig(fig)
+    else:
+        fig.savefig(out)
+
+def _render(task):
+    """Worker entry point: unpack a (renderer, args) task and run it"""
+    func, args = task
+    func(*args)
+
+# Row formatting kernels over parallel float64 column arrays. Keeping them as
+# flat loops over SoA scalars makes them jit-compilable in principle; numba's
+# f-string support still excludes format specs, so they run as plain Python
+# rather than pulling in the dependency for no compiled win.
+
+def _fmt_performance_rows(noise, pg_mean, pg_std, pg_min, pg_max,
+                          v_mean, v_std, v_min, v_max, g_mean, g_std):
+    """Format performance table rows from parallel column arrays"""
+    return [
+        f"{noise[i]} & {pg_mean[i]:.2f} $\\pm$ {pg_std[i]:.2f} & "
+        f"[{pg_min[i]:.2f}, {pg_max[i]:.2f}] & "
+        f"{v_mean[i]:.2f} $\\pm$ {v_std[i]:.2f} & "
+        f"[{v_min[i]:.2f}, {v_max[i]:.2f}] & "
+        f"{g_mean[i]:.0f} & {g_std[i]:.0f} \\\\\n"
+        for i in range(len(noise))
+    ]
+
+def _fmt_transaction_rows(noise, tt_mean, tt_std, tt_min, tt_max,
+                          e_mean, e_std, e_min, e_max, g_mean, g_std):
+    """Format transaction table rows from parallel column arrays"""
+    return [
+        f"{noise[i]} & {tt_mean[i]:.2f} $\\pm$ {tt_std[i]:.2f} & "
+        f"[{tt_min[i]:.2f}, {tt_max[i]:.2f}] & "
+        f"{e_mean[i]:.2f} $\\pm$ {e_std[i]:.2f} & "
+        f"[{e_min[i]:.2f}, {e_max[i]:.2f}] & "
+        f"{g_mean[i]:.0f} & {g_std[i]:.0f} \\\\\n"
+        for i in range(len(noise))
+    ]
+
 class ExperimentVisualizer:
+    # Columns the plotting and table methods actually consume, with narrowed
+    # dtypes where the value ranges permit; everything else in the CSVs is
+    # skipped at parse time. Heap sizes stay at full width since they can
+    # exceed int32, and NoiseLevel stays float64 because the tables print it
+    # verbatim as the group key (float32 round-trips as 0.05000000074...).
+    PERF_COLS = ['NoiseLevel', 'ProofGenTime', 'VerifyTime', 'GasUsed']
+    PERF_DTYPES = {'ProofGenTime': 'float32', 'VerifyTime': 'float32',
+                   'GasUsed': 'int32'}
+    REL_COLS = ['NoiseLevel', 'Success']
+    MEM_COLS = ['Timestamp', 'HeapUsed', 'HeapTotal']
+    TX_COLS = ['NoiseLevel', 'TransactionTime', 'ProofTime',
+               'EncryptionTime', 'GasUsed']
+    TX_DTYPES = {'TransactionTime': 'float32', 'ProofTime': 'float32',
+                 'EncryptionTime': 'float32', 'GasUsed': 'int32'}
+
     def __init__(self):
-        self.plt_style()
-        
-        # Define required filenames
-        required_files = [
-            'performance_results.csv',
-            'reliability_results.csv',
-            'memory_results.csv',
-            'transaction_results.csv'
-        ]
-        
         # Set results_dir relative to the script's location
         script_dir = Path(__file__).parent.resolve()
         self.results_dir = (script_dir / '../results').resolve()
         print(f"Resolved results directory: {self.results_dir}")
-        
+
         self.output_dir = self.results_dir / 'analysis'
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Check existence of required files
-        for filename in required_files:
-            file_path = self.results_dir / filename
-            print(f"Checking for file: {file_path}")
-            if not file_path.exists():
-                raise FileNotFoundError(f"Required file '{file_path}' not found.")
-        
-        # Read data
-        self.perf_df = pd.read_csv(self.results_dir / 'performance_results.csv')
-        self.rel_df = pd.read_csv(self.results_dir / 'reliability_results.csv')
-        self.mem_df = pd.read_csv(self.results_dir / 'memory_results.csv')
-        self.tx_df = pd.read_csv(self.results_dir / 'transaction_results.csv')
-        
-        # Convert timestamps
-        for df in [self.perf_df, self.rel_df, self.mem_df, self.tx_df]:
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'])
-    
-    def plt_style(self):
-        """Set publication-quality plot style"""
-        sns.set_theme(style='whitegrid')
-        plt.rcParams.update({
-            'font.size': 11,
-            'font.family': 'serif',
-            'font.serif': ['DejaVu Serif'],
-            'axes.labelsize': 12,
-            'axes.titlesize': 12,
-            'figure.figsize': (8, 6),
-            'figure.dpi': 300,
-            'savefig.bbox': 'tight',
-            'savefig.pad_inches': 0.1,
-        })
+
+        # Read data; pandas raises FileNotFoundError itself if a file is missing.
+        # The pyarrow engine parses in parallel and skips Python-level type
+        # inference; parse_dates handles Timestamp during the parse. The four
+        # reads release the GIL inside the parser, so dispatching them through
+        # a thread pool overlaps their I/O and parse cost.
+        specs = {
+            'perf_df': ('performance_results.csv',
+                        self.PERF_COLS, self.PERF_DTYPES, None),
+            'rel_df': ('reliability_results.csv',
+                       self.REL_COLS, None, None),
+            'mem_df': ('memory_results.csv',
+                       self.MEM_COLS, None, ['Timestamp']),
+            'tx_df': ('transaction_results.csv',
+                      self.TX_COLS, self.TX_DTYPES, None),
+        }
+        try:
+            with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+                futures = {
+                    name: executor.submit(_load_cached, self.results_dir / fname,
+                                          usecols, dtype, parse_dates)
+                    for name, (fname, usecols, dtype, parse_dates) in specs.items()
+                }
+                frames = {name: future.result() for name, future in futures.items()}
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Required file '{e.filename}' not found.")
+        # Newest input mtime, for make-style staleness checks on the outputs
+        self._src_mtime = max((self.results_dir / fname).stat().st_mtime
+                              for fname, *_ in specs.values())
+        self.perf_df = frames['perf_df']
+        self.rel_df = frames['rel_df']
+        self.mem_df = frames['mem_df']
+        self.tx_df = frames['tx_df']
+
+        # Hot columns as contiguous SoA arrays; the plotting routines walk
+        # these instead of striding through the backing DataFrame blocks.
+        self.perf_arrays = _to_soa(self.perf_df,
+                                   ('NoiseLevel', 'ProofGenTime', 'VerifyTime', 'GasUsed'))
+        self.rel_arrays = _to_soa(self.rel_df, ('NoiseLevel', 'Success'))
+        self.mem_arrays = _to_soa(self.mem_df, ('Timestamp', 'HeapUsed', 'HeapTotal'))
+        self.tx_arrays = _to_soa(self.tx_df,
+                                 ('NoiseLevel', 'TransactionTime', 'EncryptionTime', 'GasUsed'))
+
+        # Aggregate per-NoiseLevel statistics once; the plotting and table
+        # methods all reuse these instead of re-scanning the raw frames.
+        self._perf_stats = self.perf_df.groupby('NoiseLevel').agg({
+            'ProofGenTime': ['mean', 'std', 'min', 'max'],
+            'VerifyTime': ['mean', 'std', 'min', 'max'],
+            'GasUsed': ['mean', 'std']
+        }).round(2)
+        self._rel_stats = self.rel_df.groupby('NoiseLevel').agg({
+            'Success': ['count', 'mean', 'std']
+        }).round(4)
+        self._tx_stats = self.tx_df.groupby('NoiseLevel').agg({
+            'TransactionTime': ['mean', 'std', 'min', 'max'],
+            'ProofTime': ['mean', 'std', 'min', 'max'],
+            'EncryptionTime': ['mean', 'std', 'min', 'max'],
+            'GasUsed': ['mean', 'std']
+        }).round(2)
+        # Flatten the MultiIndex columns so the table formatters can use
+        # attribute access via itertuples instead of chained __getitem__.
+        for stats in (self._perf_stats, self._rel_stats, self._tx_stats):
+            stats.columns = [f"{col}_{stat}" for col, stat in stats.columns]
+
+    def _grouped(self, arrays, col):
+        """Group an SoA column by NoiseLevel into contiguous float64 arrays"""
+        levels, inv = np.unique(arrays['NoiseLevel'], return_inverse=True)
+        order = np.argsort(inv, kind='stable')
+        values = arrays[col].astype(np.float64, copy=False)[order]
+        groups = np.split(values, np.cumsum(np.bincount(inv))[:-1])
+        return list(levels), groups
+
+    def _plot_tasks(self):
+        """Build the (renderer, args) task list for every plot"""
+        levels, inv = np.unique(self.rel_arrays['NoiseLevel'], return_inverse=True)
+        success = self.rel_arrays['Success'].astype(np.float64, copy=False)
+        success_rates = np.bincount(inv, weights=success) / np.bincount(inv) * 100
+
+        return [
+            (_render_performance_vs_noise,
+             (self._grouped(self.perf_arrays, 'ProofGenTime'),
+              self._grouped(self.perf_arrays, 'VerifyTime'),
+              self.output_dir / 'performance_vs_noise.pdf')),
+            (_render_boxplot,
+             (*self._grouped(self.tx_arrays, 'TransactionTime'),
+              'Transaction Time vs. Noise Level', 'Transaction Time (ms)',
+              self.output_dir / 'transaction_time_vs_noise.pdf')),
+            (_render_boxplot,
+             (*self._grouped(self.tx_arrays, 'EncryptionTime'),
+              'Encryption Time vs. Noise Level', 'Encryption Time (ms)',
+              self.output_dir / 'encryption_time_vs_noise.pdf')),
+            (_render_success_rate,
+             (levels, success_rates, self.output_dir / 'success_rate.pdf')),
+            (_render_gas_histogram,
+             (self.perf_arrays['GasUsed'],
+              'Distribution of Gas Usage for Authentication',
+              self.output_dir / 'authentication_gas_usage.pdf')),
+            (_render_gas_histogram,
+             (self.tx_arrays['GasUsed'],
+              'Distribution of Gas Usage for Transactions',
+              self.output_dir / 'transaction_gas_usage.pdf')),
+            (_render_memory_usage,
+             (self.mem_arrays['Timestamp'],
+              self.mem_arrays['HeapUsed'], self.mem_arrays['HeapTotal'],
+              self.output_dir / 'memory_usage.pdf')),
+        ]
 
     def plot_performance_vs_noise(self):
         """Plot proof generation and verification times vs noise levels"""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-        
-        # Box plots for proof generation time
-        sns.boxplot(data=self.perf_df, x='NoiseLevel', y='ProofGenTime', ax=ax1)
-        ax1.set_title('Proof Generation Time vs. Noise Level')
-        ax1.set_xlabel('Noise Level')
-        ax1.set_ylabel('Time (ms)')
-        
-        # Box plots for verification time
-        sns.boxplot(data=self.perf_df, x='NoiseLevel', y='VerifyTime', ax=ax2)
-        ax2.set_title('Verification Time vs. Noise Level')
-        ax2.set_xlabel('Noise Level')
-        ax2.set_ylabel('Time (ms)')
-        
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'performance_vs_noise.pdf')
-        plt.close()
+        _render_performance_vs_noise(
+            self._grouped(self.perf_arrays, 'ProofGenTime'),
+            self._grouped(self.perf_arrays, 'VerifyTime'),
+            self.output_dir / 'performance_vs_noise.pdf')
 
     def plot_transaction_times(self):
         """Plot transaction times vs noise levels"""
-        plt.figure(figsize=(8, 6))
-        sns.boxplot(data=self.tx_df, x='NoiseLevel', y='TransactionTime')
-        plt.title('Transaction Time vs. Noise Level')
-        plt.xlabel('Noise Level')
-        plt.ylabel('Transaction Time (ms)')
-        plt.savefig(self.output_dir / 'transaction_time_vs_noise.pdf')
-        plt.close()
+        levels, arrays = self._grouped(self.tx_arrays, 'TransactionTime')
+        _render_boxplot(levels, arrays, 'Transaction Time vs. Noise Level',
+                        'Transaction Time (ms)',
+                        self.output_dir / 'transaction_time_vs_noise.pdf')
 
     def plot_encryption_times(self):
         """Plot encryption times vs noise levels"""
-        plt.figure(figsize=(8, 6))
-        sns.boxplot(data=self.tx_df, x='NoiseLevel', y='EncryptionTime')
-        plt.title('Encryption Time vs. Noise Level')
-        plt.xlabel('Noise Level')
-        plt.ylabel('Encryption Time (ms)')
-        plt.savefig(self.output_dir / 'encryption_time_vs_noise.pdf')
-        plt.close()
+        levels, arrays = self._grouped(self.tx_arrays, 'EncryptionTime')
+        _render_boxplot(levels, arrays, 'Encryption Time vs. Noise Level',
+                        'Encryption Time (ms)',
+                        self.output_dir / 'encryption_time_vs_noise.pdf')
 
     def plot_transaction_gas_usage(self):
         """Plot gas usage for transactions"""
-        plt.figure(figsize=(8, 6))
-        sns.histplot(data=self.tx_df, x='GasUsed', bins=30, kde=True)
-        plt.title('Distribution of Gas Usage for Transactions')
-        plt.xlabel('Gas Used')
-        plt.ylabel('Frequency')
-        plt.savefig(self.output_dir / 'transaction_gas_usage.pdf')
-        plt.close()
+        _render_gas_histogram(self.tx_arrays['GasUsed'],
+                              'Distribution of Gas Usage for Transactions',
+                              self.output_dir / 'transaction_gas_usage.pdf')
 
     def plot_success_rate(self):
         """Plot authentication success rate vs noise level"""
-        success_rates = self.rel_df.groupby('NoiseLevel')['Success'].mean() * 100
-        
-        plt.figure(figsize=(8, 6))
-        success_rates.plot(marker='o')
-        plt.title('Authentication Success Rate vs. Noise Level')
-        plt.xlabel('Noise Level')
-        plt.ylabel('Success Rate (%)')
-        plt.grid(True, alpha=0.3)
-        plt.savefig(self.output_dir / 'success_rate.pdf')
-        plt.close()
+        # Per-level mean via bincount: much cheaper than groupby machinery
+        # for a low-cardinality key.
+        levels, inv = np.unique(self.rel_arrays['NoiseLevel'], return_inverse=True)
+        success = self.rel_arrays['Success'].astype(np.float64, copy=False)
+        success_rates = np.bincount(inv, weights=success) / np.bincount(inv) * 100
+        _render_success_rate(levels, success_rates,
+                             self.output_dir / 'success_rate.pdf')
 
     def plot_gas_usage(self):
         """Plot gas usage distribution"""
-        plt.figure(figsize=(8, 6))
-        sns.histplot(data=self.perf_df, x='GasUsed', bins=30, kde=True)
-        plt.title('Distribution of Gas Usage for Authentication')
-        plt.xlabel('Gas Used')
-        plt.ylabel('Frequency')
-        plt.savefig(self.output_dir / 'authentication_gas_usage.pdf')
-        plt.close()
+        _render_gas_histogram(self.perf_arrays['GasUsed'],
+                              'Distribution of Gas Usage for Authentication',
+                              self.output_dir / 'authentication_gas_usage.pdf')
 
     def plot_memory_usage(self):
         """Plot memory usage over time"""
-        plt.figure(figsize=(10, 6))
-        plt.plot(self.mem_df['Timestamp'], self.mem_df['HeapUsed'] / 1024 / 1024, label='Heap Used')
-        plt.plot(self.mem_df['Timestamp'], self.mem_df['HeapTotal'] / 1024 / 1024, label='Heap Total')
-        plt.title('Memory Usage Over Time')
-        plt.xlabel('Time')
-        plt.ylabel('Memory (MB)')
-        plt.legend()
-        plt.xticks(rotation=45)
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        plt.savefig(self.output_dir / 'memory_usage.pdf')
-        plt.close()
+        _render_memory_usage(self.mem_arrays['Timestamp'],
+                             self.mem_arrays['HeapUsed'],
+                             self.mem_arrays['HeapTotal'],
+                             self.output_dir / 'memory_usage.pdf')
 
     def generate_latex_tables(self):
         """Generate LaTeX tables for the paper"""
-        # Performance statistics table
-        perf_stats = self.perf_df.groupby('NoiseLevel').agg({
-            'ProofGenTime': ['mean', 'std', 'min', 'max'],
-            'VerifyTime': ['mean', 'std', 'min', 'max'],
-            'GasUsed': ['mean', 'std']
-        }).round(2)
-
-        # Reliability statistics table
-        rel_stats = self.rel_df.groupby('NoiseLevel').agg({
-            'Success': ['count', 'mean', 'std']
-        }).round(4)
-
-        # Transaction statistics table
-        tx_stats = self.tx_df.groupby('NoiseLevel').agg({
-            'TransactionTime': ['mean', 'std', 'min', 'max'],
-            'ProofTime': ['mean', 'std', 'min', 'max'],
-            'EncryptionTime': ['mean', 'std', 'min', 'max'],
-            'GasUsed': ['mean', 'std']
-        }).round(2)
-
-        # Generate LaTeX tables
+        # Statistics are pre-aggregated once in __init__
         with open(self.output_dir / 'tables.tex', 'w') as f:
-            f.write(self._format_performance_table(perf_stats))
+            f.write(self._format_performance_table(self._perf_stats))
             f.write('\n\n')
-            f.write(self._format_reliability_table(rel_stats))
+            f.write(self._format_reliability_table(self._rel_stats))
             f.write('\n\n')
-            f.write(self._format_transactions_table(tx_stats))
+            f.write(self._format_transactions_table(self._tx_stats))
 
     def _format_performance_table(self, stats):
         """Format performance statistics as LaTeX table"""
-        latex = """
+        buf = io.StringIO()
+        buf.write("""
 \\begin{table}[ht]
 \\centering
 \\caption{Authentication Performance Metrics at Different Noise Levels}
@@ -189,23 +432,24 @@ class ExperimentVisualizer:
 Noise & \\multicolumn{2}{c}{Proof Generation (ms)} & \\multicolumn{2}{c}{Verification (ms)} & \\multicolumn{2}{c}{Gas Used} \\\\
 Level & Mean $\\pm$ Std & Range & Mean $\\pm$ Std & Range & Mean & Std \\\\
 \\hline
-"""
-        for noise in stats.index:
-            row = stats.loc[noise]
-            latex += f"{noise} & {row['ProofGenTime']['mean']:.2f} $\\pm$ {row['ProofGenTime']['std']:.2f} & "
-            latex += f"[{row['ProofGenTime']['min']:.2f}, {row['ProofGenTime']['max']:.2f}] & "
-            latex += f"{row['VerifyTime']['mean']:.2f} $\\pm$ {row['VerifyTime']['std']:.2f} & "
-            latex += f"[{row['VerifyTime']['min']:.2f}, {row['VerifyTime']['max']:.2f}] & "
-            latex += f"{row['GasUsed']['mean']:.0f} & {row['GasUsed']['std']:.0f} \\\\\n"
-        
-        latex += """\\hline
+""")
+        cols = (stats[c].to_numpy(np.float64) for c in (
+            'ProofGenTime_mean', 'ProofGenTime_std',
+            'ProofGenTime_min', 'ProofGenTime_max',
+            'VerifyTime_mean', 'VerifyTime_std',
+            'VerifyTime_min', 'VerifyTime_max',
+            'GasUsed_mean', 'GasUsed_std'))
+        buf.writelines(_fmt_performance_rows(stats.index.to_numpy(), *cols))
+
+        buf.write("""\\hline
 \\end{tabular}
-\\end{table}"""
-        return latex
+\\end{table}""")
+        return buf.getvalue()
 
     def _format_reliability_table(self, stats):
         """Format reliability statistics as LaTeX table"""
-        latex = """
+        buf = io.StringIO()
+        buf.write("""
 \\begin{table}[ht]
 \\centering
 \\caption{Authentication Reliability Metrics at Different Noise Levels}
@@ -215,21 +459,23 @@ Level & Mean $\\pm$ Std & Range & Mean $\\pm$ Std & Range & Mean & Std \\\\
 Noise & Number of & Success & Standard \\\\
 Level & Tests & Rate & Deviation \\\\
 \\hline
-"""
-        for noise in stats.index:
-            row = stats.loc[noise]
-            latex += f"{noise} & {int(row['Success']['count'])} & "
-            latex += f"{row['Success']['mean']*100:.2f}\\% & "
-            latex += f"{row['Success']['std']*100:.2f}\\% \\\\\n"
-        
-        latex += """\\hline
+""")
+        buf.writelines(
+            f"{row.Index} & {int(row.Success_count)} & "
+            f"{row.Success_mean * 100:.2f}\\% & "
+            f"{row.Success_std * 100:.2f}\\% \\\\\n"
+            for row in stats.itertuples()
+        )
+
+        buf.write("""\\hline
 \\end{tabular}
-\\end{table}"""
-        return latex
+\\end{table}""")
+        return buf.getvalue()
 
     def _format_transactions_table(self, stats):
         """Format transaction statistics as LaTeX table"""
-        latex = """
+        buf = io.StringIO()
+        buf.write("""
 \\begin{table}[ht]
 \\centering
 \\caption{Transaction Performance Metrics at Different Noise Levels}
@@ -239,44 +485,69 @@ Level & Tests & Rate & Deviation \\\\
 Noise & \\multicolumn{2}{c}{Transaction Time (ms)} & \\multicolumn{2}{c}{Encryption Time (ms)} & \\multicolumn{2}{c}{Gas Used} \\\\
 Level & Mean $\\pm$ Std & Range & Mean $\\pm$ Std & Range & Mean & Std \\\\
 \\hline
-"""
-        for noise in stats.index:
-            row = stats.loc[noise]
-            latex += f"{noise} & {row['TransactionTime']['mean']:.2f} $\\pm$ {row['TransactionTime']['std']:.2f} & "
-            latex += f"[{row['TransactionTime']['min']:.2f}, {row['TransactionTime']['max']:.2f}] & "
-            latex += f"{row['EncryptionTime']['mean']:.2f} $\\pm$ {row['EncryptionTime']['std']:.2f} & "
-            latex += f"[{row['EncryptionTime']['min']:.2f}, {row['EncryptionTime']['max']:.2f}] & "
-            latex += f"{row['GasUsed']['mean']:.0f} & {row['GasUsed']['std']:.0f} \\\\\n"
-        
-        latex += """\\hline
+""")
+        cols = (stats[c].to_numpy(np.float64) for c in (
+            'TransactionTime_mean', 'TransactionTime_std',
+            'TransactionTime_min', 'TransactionTime_max',
+            'EncryptionTime_mean', 'EncryptionTime_std',
+            'EncryptionTime_min', 'EncryptionTime_max',
+            'GasUsed_mean', 'GasUsed_std'))
+        buf.writelines(_fmt_transaction_rows(stats.index.to_numpy(), *cols))
+
+        buf.write("""\\hline
 \\end{tabular}
-\\end{table}"""
-        return latex
+\\end{table}""")
+        return buf.getvalue()
+
+    def _needs_rebuild(self, out_path):
+        """Check whether an output is missing or older than the newest CSV"""
+        if os.environ.get('PUFZIN_FORCE'):
+            return True
+        return not out_path.exists() or out_path.stat().st_mtime < self._src_mtime
 
     def run_all_visualizations(self):
-        """Generate all plots and tables"""
-        print("Generating performance plots...")
-        self.plot_performance_vs_noise()
-        
-        print("Generating transaction time plot...")
-        self.plot_transaction_times()
-        
-        print("Generating encryption time plot...")
-        self.plot_encryption_times()
-        
-        print("Generating authentication success rate plot...")
-        self.plot_success_rate()
-        
-        print("Generating gas usage plots...")
-        self.plot_gas_usage()
-        self.plot_transaction_gas_usage()
-        
-        print("Generating memory usage plot...")
-        self.plot_memory_usage()
-        
-        print("Generating LaTeX tables...")
-        self.generate_latex_tables()
-        
+        """Generate all plots and tables (only the stale ones, make-style)"""
+        # Every task's last argument is its output path; regenerate only the
+        # targets that are missing or older than the inputs. PUFZIN_FORCE=1
+        # rebuilds everything.
+        if os.environ.get('PUFZIN_COMBINED_PDF'):
+            # Single-writer mode: every figure becomes a page of one PDF, so
+            # the header/trailer and font subset are emitted once. This
+            # serializes rendering, hence it is opt-in. The pages cannot be
+            # rebuilt individually, so staleness is checked on the one file.
+            combined = self.output_dir / 'all_plots.pdf'
+            if self._needs_rebuild(combined):
+                tasks = self._plot_tasks()
+                print(f"Rendering {len(tasks)} plots into all_plots.pdf...")
+                _set_plot_style()
+                from matplotlib.backends.backend_pdf import PdfPages
+                with PdfPages(combined) as pdf:
+                    for func, args in tasks:
+                        func(*args[:-1], pdf)
+            else:
+                print("all_plots.pdf is up to date, skipping.")
+        else:
+            tasks = [task for task in self._plot_tasks()
+                     if self._needs_rebuild(task[1][-1])]
+            if tasks:
+                workers = min(len(tasks), os.cpu_count() or 1)
+                print(f"Rendering {len(tasks)} plots with {workers} workers...")
+                # Each figure renders independently under Agg, so fan the
+                # tasks out over a process pool; spawn keeps workers free of
+                # inherited state and the initializer applies the plot style
+                # once per worker.
+                ctx = multiprocessing.get_context('spawn')
+                with ctx.Pool(processes=workers, initializer=_set_plot_style) as pool:
+                    pool.map(_render, tasks)
+            else:
+                print("All plots are up to date, skipping.")
+
+        if self._needs_rebuild(self.output_dir / 'tables.tex'):
+            print("Generating LaTeX tables...")
+            self.generate_latex_tables()
+        else:
+            print("tables.tex is up to date, skipping.")
+
         print(f"All visualizations saved to {self.output_dir}")
 
 if __name__ == "__main__":
@@ -1,15 +1,59 @@
 # scripts/visualize_scalability.py
 
+# matplotlib is imported lazily inside the plot methods, so the tables-only
+# path never pays the pyplot import or rcParams rewrite.
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
+import io
 from pathlib import Path
 
+def _load_cached(csv_path, usecols=None, dtype=None, parse_dates=None):
+    """Load a results CSV, caching the parsed frame as a Feather sibling.
+
+    Feather skips text tokenization and type inference entirely, so reloads
+    are an order of magnitude faster than re-parsing the CSV. The cache is
+    refreshed whenever the CSV is newer than its Feather sibling. usecols
+    limits parsing to the columns actually consumed and dtype narrows them,
+    shrinking both parse time and the resident frames.
+    """
+    feather_path = csv_path.with_suffix('.feather')
+    if feather_path.exists() and feather_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        return pd.read_feather(feather_path, columns=usecols,
+                               dtype_backend='pyarrow')
+    df = pd.read_csv(csv_path, engine='pyarrow', dtype_backend='pyarrow',
+                     usecols=usecols, dtype=dtype, parse_dates=parse_dates)
+    df.to_feather(feather_path)
+    return df
+
+def _fmt_scalability_rows(batch, devices, tt_mean, tt_std,
+                          sr_mean, sr_std, rt_mean, rt_std):
+    """Format scalability table rows from parallel column arrays.
+
+    Kept as a flat kernel over SoA scalars so it could be jit-compiled;
+    numba's f-string support still excludes format specs, so it runs as
+    plain Python rather than pulling in the dependency for no compiled win.
+    """
+    return [
+        f"{batch[i]} & {devices[i]} & "
+        f"{tt_mean[i]:.2f} $\\pm$ {tt_std[i]:.2f} & "
+        f"{sr_mean[i]:.2f} $\\pm$ {sr_std[i]:.2f} & "
+        f"{rt_mean[i]:.2f} $\\pm$ {rt_std[i]:.2f} \\\\\n"
+        for i in range(len(batch))
+    ]
+
 class ScalabilityVisualizer:
+    # Columns the plotting and table methods actually consume, with narrowed
+    # dtypes where the value ranges permit; everything else in the CSV is
+    # skipped at parse time.
+    SCALE_COLS = ['BatchSize', 'ConcurrentDevices', 'TotalTime',
+                  'AverageResponseTime', 'SuccessRate', 'SuccessfulProofs']
+    SCALE_DTYPES = {'BatchSize': 'int32', 'ConcurrentDevices': 'int32',
+                    'TotalTime': 'float32', 'AverageResponseTime': 'float32',
+                    'SuccessRate': 'float32', 'SuccessfulProofs': 'int32'}
+
     def __init__(self):
         print("Initializing ScalabilityVisualizer")
-        self.plt_style()
+        self._style_done = False
         
         # Set results_dir relative to the script's location
         script_dir = Path(__file__).parent.resolve()
@@ -22,8 +66,9 @@ class ScalabilityVisualizer:
         
         # Read scalability data with exception handling
         try:
-            self.scale_df = pd.read_csv(self.results_dir / 'scalability_results.csv')
-            self.scale_df['Timestamp'] = pd.to_datetime(self.scale_df['Timestamp'])
+            self.scale_df = _load_cached(self.results_dir / 'scalability_results.csv',
+                                         usecols=self.SCALE_COLS,
+                                         dtype=self.SCALE_DTYPES)
             print("Successfully read 'scalability_results.csv'")
         except FileNotFoundError:
             print("Error: 'scalability_results.csv' not found in the results directory.")
@@ -35,32 +80,67 @@ class ScalabilityVisualizer:
             print(f"An unexpected error occurred while reading 'scalability_results.csv': {e}")
             return
 
+        # Group by batch size once; the plot methods iterate these blocks
+        # instead of re-scanning the frame with a boolean mask per batch size.
+        self._scale_groups = list(self.scale_df.groupby('BatchSize', sort=True))
+
+        # SoA views of the hot columns plus group-inverse indices, so derived
+        # quantities like throughput are computed in one vectorized pass.
+        self._devices = self.scale_df['ConcurrentDevices'].to_numpy(np.float64)
+        self._total_time = self.scale_df['TotalTime'].to_numpy(np.float64)
+        self._batch_levels, self._batch_inv = np.unique(
+            self.scale_df['BatchSize'].to_numpy(), return_inverse=True)
+
     def plt_style(self):
-        """Set publication-quality plot style"""
-        sns.set_theme(style='whitegrid')
+        """Set publication-quality plot style (idempotent)"""
+        if self._style_done:
+            return
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        from matplotlib import font_manager
+
+        # Resolve the serif font up front: findfont caches the hit, so the
+        # first savefig never stalls on a font-cache rebuild, and the generic
+        # 'serif' fallback short-circuits the lookup if DejaVu Serif is
+        # missing.
+        font_manager.findfont('DejaVu Serif')
+        # matplotlib ships the seaborn whitegrid theme, so applying it does
+        # not need the seaborn import on the hot path.
+        plt.style.use('seaborn-v0_8-whitegrid')
         plt.rcParams.update({
             'font.size': 11,
             'font.family': 'serif',
-            'font.serif': ['DejaVu Serif'],
+            'font.serif': ['DejaVu Serif', 'serif'],
             'axes.labelsize': 12,
             'axes.titlesize': 12,
             'figure.figsize': (8, 6),
-            'figure.dpi': 300,
+            # PDFs are vector output: the DPI only sizes Agg's intermediate
+            # raster buffers, so 100 cuts per-figure memory 9x vs 300.
+            'figure.dpi': 100,
+            'savefig.dpi': 'figure',
             'savefig.bbox': 'tight',
             'savefig.pad_inches': 0.1,
+            # TrueType embedding and no TeX round-trips keep font handling
+            # cheap during savefig, which dominates publication-style PDF
+            # writes.
+            'pdf.fonttype': 42,
+            'text.usetex': False,
         })
+        self._style_done = True
 
     def plot_throughput(self):
         """Plot system throughput for different batch sizes"""
+        self.plt_style()
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(10, 6))
-        
-        for batch_size in self.scale_df['BatchSize'].unique():
-            batch_data = self.scale_df[self.scale_df['BatchSize'] == batch_size]
-            
-            # Calculate throughput (devices/second)
-            throughput = batch_data['ConcurrentDevices'] / (batch_data['TotalTime'] / 1000)
-            
-            plt.plot(batch_data['ConcurrentDevices'], throughput, 
+
+        # Calculate throughput (devices/second) for the whole column in one
+        # vectorized divide, then slice it per batch size.
+        throughput = self._devices * 1000.0 / self._total_time
+        for i, batch_size in enumerate(self._batch_levels):
+            mask = self._batch_inv == i
+            plt.plot(self._devices[mask], throughput[mask],
                     marker='o', label=f'Batch Size {batch_size}')
         
         plt.title('System Throughput vs. Number of Devices')
@@ -73,10 +153,11 @@ class ScalabilityVisualizer:
 
     def plot_response_time(self):
         """Plot average response time vs system load"""
+        self.plt_style()
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(10, 6))
         
-        for batch_size in self.scale_df['BatchSize'].unique():
-            batch_data = self.scale_df[self.scale_df['BatchSize'] == batch_size]
+        for batch_size, batch_data in self._scale_groups:
             plt.plot(batch_data['ConcurrentDevices'], 
                     batch_data['AverageResponseTime'],
                     marker='o', label=f'Batch Size {batch_size}')
@@ -91,10 +172,11 @@ class ScalabilityVisualizer:
 
     def plot_success_rate_scaling(self):
         """Plot success rate vs system load"""
+        self.plt_style()
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(10, 6))
         
-        for batch_size in self.scale_df['BatchSize'].unique():
-            batch_data = self.scale_df[self.scale_df['BatchSize'] == batch_size]
+        for batch_size, batch_data in self._scale_groups:
             plt.plot(batch_data['ConcurrentDevices'], 
                     batch_data['SuccessRate'],
                     marker='o', label=f'Batch Size {batch_size}')
@@ -109,19 +191,35 @@ class ScalabilityVisualizer:
 
     def plot_batch_efficiency(self):
         """Plot batch processing efficiency"""
-        efficiency_data = self.scale_df.groupby(['BatchSize', 'ConcurrentDevices']).agg({
-            'TotalTime': 'mean',
-            'SuccessfulProofs': 'sum',
-            'FailedProofs': 'sum'
-        }).reset_index()
-        
-        efficiency_data['Efficiency'] = (efficiency_data['SuccessfulProofs'] * 1000) / efficiency_data['TotalTime']
-        
+        self.plt_style()
+        import matplotlib.pyplot as plt
+        # Fuse the (BatchSize, ConcurrentDevices) aggregation and the
+        # efficiency computation into one pass: sort once, find the group
+        # boundaries, and reduce both columns with np.add.reduceat.
+        batch_sizes = self.scale_df['BatchSize'].to_numpy()
+        devices = self.scale_df['ConcurrentDevices'].to_numpy()
+        proofs = self.scale_df['SuccessfulProofs'].to_numpy(np.float64)
+
+        order = np.lexsort((devices, batch_sizes))
+        batch_sizes = batch_sizes[order]
+        devices = devices[order]
+        is_start = np.empty(len(order), dtype=bool)
+        is_start[0] = True
+        is_start[1:] = ((batch_sizes[1:] != batch_sizes[:-1])
+                        | (devices[1:] != devices[:-1]))
+        starts = np.flatnonzero(is_start)
+        counts = np.diff(np.append(starts, len(order)))
+
+        proof_sums = np.add.reduceat(proofs[order], starts)
+        time_means = np.add.reduceat(self._total_time[order], starts) / counts
+        efficiency = proof_sums * 1000.0 / time_means
+        group_batch = batch_sizes[starts]
+        group_devices = devices[starts]
+
         plt.figure(figsize=(10, 6))
-        for batch_size in efficiency_data['BatchSize'].unique():
-            batch_data = efficiency_data[efficiency_data['BatchSize'] == batch_size]
-            plt.plot(batch_data['ConcurrentDevices'], 
-                    batch_data['Efficiency'],
+        for batch_size in np.unique(group_batch):
+            mask = group_batch == batch_size
+            plt.plot(group_devices[mask], efficiency[mask],
                     marker='o', label=f'Batch Size {batch_size}')
         
         plt.title('Batch Processing Efficiency')
@@ -140,6 +238,9 @@ class ScalabilityVisualizer:
             'SuccessRate': ['mean', 'std'],
             'AverageResponseTime': ['mean', 'std']
         }).round(2)
+        # Flatten the MultiIndex columns so the formatter can use attribute
+        # access via itertuples instead of chained __getitem__.
+        stats.columns = [f"{col}_{stat}" for col, stat in stats.columns]
 
         # Generate LaTeX table
         with open(self.output_dir / 'scalability_tables.tex', 'w') as f:
@@ -147,7 +248,8 @@ class ScalabilityVisualizer:
 
     def _format_scalability_table(self, stats):
         """Format scalability statistics as LaTeX table"""
-        latex = """
+        buf = io.StringIO()
+        buf.write("""
 \\begin{table}[ht]
 \\centering
 \\caption{System Scalability Metrics}
@@ -157,15 +259,17 @@ class ScalabilityVisualizer:
 Batch & Concurrent & Total Time & Success & Response \\\\
 Size & Devices & (ms) & Rate (\\%) & Time (ms) \\\\
 \\hline
-"""
-        for (batch_size, devices) in stats.index:
-            row = stats.loc[(batch_size, devices)]
-            latex += f"{batch_size} & {devices} & "
-            latex += f"{row['TotalTime']['mean']:.2f} $\\pm$ {row['TotalTime']['std']:.2f} & "
-            latex += f"{row['SuccessRate']['mean']:.2f} $\\pm$ {row['SuccessRate']['std']:.2f} & "
-            latex += f"{row['AverageResponseTime']['mean']:.2f} $\\pm$ {row['AverageResponseTime']['std']:.2f} \\\\\n"
-        latex += """
+""")
+        cols = (stats[c].to_numpy(np.float64) for c in (
+            'TotalTime_mean', 'TotalTime_std',
+            'SuccessRate_mean', 'SuccessRate_std',
+            'AverageResponseTime_mean', 'AverageResponseTime_std'))
+        buf.writelines(_fmt_scalability_rows(
+            stats.index.get_level_values(0).to_numpy(),
+            stats.index.get_level_values(1).to_numpy(),
+            *cols))
+        buf.write("""
 \\end{tabular}
 \\end{table}
-"""
-        return latex
\ No newline at end of file
+""")
+        return buf.getvalue()
\ No newline at end of file